@@ -7,6 +7,8 @@ from config import Config
 
 
 GUILD_ID = Config.secrets["discord"]["guild_id"]
+GUILD_IDS = [GUILD_ID]
+EMBED_COLOR = discord.Color.from_rgb(78, 42, 132)
 
 
 class Gameroom(commands.Cog):
@@ -16,7 +18,7 @@ class Gameroom(commands.Cog):
 
     gameroom = discord.SlashCommandGroup("gameroom", "Game Room and Nexus Gaming Lounge commands")
 
-    @gameroom.command(name="hours", description="Lists current game room hours", guild_ids=[GUILD_ID])
+    @gameroom.command(name="hours", description="Lists current game room hours", guild_ids=GUILD_IDS)
     async def hours(self, ctx):
         default_hours = Config.config["gameroom"]["default_hours"]
         adjusted_hours = Config.config["gameroom"]["adjusted_hours"]
@@ -28,7 +30,7 @@ class Gameroom(commands.Cog):
 
         embed = discord.Embed(
             title="Game Room Hours",
-            color=discord.Color.from_rgb(78, 42, 132),
+            color=EMBED_COLOR,
         )
 
         embed.add_field(name=f"Week of {start.strftime('%-m/%-d')} - {end.strftime('%-m/%-d')}", value="")
@@ -42,13 +44,13 @@ class Gameroom(commands.Cog):
 
         await ctx.respond("", embed=embed)
 
-    @gameroom.command(name="games", description="Lists games available on game room consoles", guild_ids=[GUILD_ID])
+    @gameroom.command(name="games", description="Lists games available on game room consoles", guild_ids=GUILD_IDS)
     async def games(self, ctx):
         games = Config.config["gameroom"]["games"]
 
         embed = discord.Embed(
             title="Game Room Games",
-            color=discord.Color.from_rgb(78, 42, 132),
+            color=EMBED_COLOR,
         )
 
         embed.add_field(name="PS4", value="\n".join(games["ps4"]), inline=True)
@@ -1,4 +1,4 @@
-import copy
+import functools
 import random
 
 import discord
@@ -8,16 +8,28 @@ from config import Config
 
 
 GUILD_ID = Config.secrets["discord"]["guild_id"]
+GUILD_IDS = [GUILD_ID]
+EMBED_COLOR = discord.Color.from_rgb(78, 42, 132)
+
+MAPS = Config.config["valorant"]["maps"]
+MAPS_ACTIVE = [MAPS[i] for i in Config.config["valorant"]["maps_active"]]
+AGENTS = Config.config["valorant"]["agents"]
+AGENTS_ROLES = {role: tuple(agents) for role, agents in Config.config["valorant"]["agents_roles"].items()}
+AGENT_POOL = [i for role in AGENTS_ROLES.values() for i in role]
 
 
 class Valorant(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+        self.lobby_embed_base = {
+            "title": "Valorant Randomized Lobby",
+            "color": EMBED_COLOR.value,
+        }
        
     valorant = discord.SlashCommandGroup("valorant", "Valorant-related utils")
 
-    @valorant.command(name="stack", description="any stackas", guild_ids=[GUILD_ID])
+    @valorant.command(name="stack", description="any stackas", guild_ids=GUILD_IDS)
     async def stack(
         self,
         ctx,
@@ -47,12 +59,12 @@ class Valorant(commands.Cog):
 
         embed = discord.Embed(
             title=name,
-            color=discord.Color.from_rgb(78, 42, 132),
+            color=EMBED_COLOR,
         )
-        embed.add_field(name="".join([":white_medium_square:" for _ in range(size)]), value="empty :/")
+        embed.add_field(name=stack_title(0, size), value="empty :/")
         await ctx.respond(embed=embed, view=ValorantStackView(embed, size))
 
-    @valorant.command(name="random-lobby", description="Generates a randomized Valorant lobby", guild_ids=[GUILD_ID])
+    @valorant.command(name="random-lobby", description="Generates a randomized Valorant lobby", guild_ids=GUILD_IDS)
     async def random_lobby(
         self,
         ctx,
@@ -75,14 +87,14 @@ class Valorant(commands.Cog):
         attackers = random_team(team_flags)
         defenders = random_team(team_flags)
 
-        embed = discord.Embed(
-            title="Valorant Randomized Lobby",
-            color=discord.Color.from_rgb(78, 42, 132),
-        )
-
-        embed.add_field(name=":map: Map", value=map, inline=False)
-        embed.add_field(name=":red_square: Attackers", value="\n".join(attackers), inline=True)
-        embed.add_field(name=":blue_square: Defenders", value="\n".join(defenders), inline=True)
+        embed = discord.Embed.from_dict({
+            **self.lobby_embed_base,
+            "fields": [
+                {"name": ":map: Map", "value": map, "inline": False},
+                {"name": ":red_square: Attackers", "value": "\n".join(attackers), "inline": True},
+                {"name": ":blue_square: Defenders", "value": "\n".join(defenders), "inline": True},
+            ],
+        })
 
         await ctx.respond("", embed=embed)
 
@@ -97,24 +109,17 @@ class ValorantStackView(discord.ui.View):
         super().__init__(timeout=1200)
         self.embed = embed
         self.joined = {}
+        self.mentions = ""
         self.pinged = False
         self.stack_size = size
 
     def update_embed(self):
-        # Title:
-        # - Green square: Person joined under limit
-        # - Yellow square: Person joined over stack size
-        # - White square: Empty slot
-        num_joined = len(self.joined)
-        name = "".join([":green_square:" if i < self.stack_size else ":yellow_square:" for i in range(num_joined)])
-        if num_joined < self.stack_size:
-            name += "".join([":white_medium_square:" for _ in range(self.stack_size - num_joined)])
+        name = stack_title(len(self.joined), self.stack_size)
 
-        # Value: display name of every user
-        value = "\n".join(user.mention for user in self.joined.values()) if self.joined else "empty :/"
+        # Value: mention of every user, kept up to date by join/leave
+        value = self.mentions or "empty :/"
 
-        self.embed.remove_field(0)
-        self.embed.add_field(name=name, value=value)
+        self.embed.set_field_at(0, name=name, value=value)
 
     async def on_timeout(self):
         self.disable_all_items()
@@ -122,7 +127,14 @@ class ValorantStackView(discord.ui.View):
 
     @discord.ui.button(label="Join", style=discord.ButtonStyle.green)
     async def join_callback(self, button, interaction):
+        # Nothing changed, so acknowledge without editing the message
+        if interaction.user.id in self.joined:
+            await interaction.response.defer()
+            return
+
         self.joined[interaction.user.id] = interaction.user
+        mention = interaction.user.mention
+        self.mentions = f"{self.mentions}\n{mention}" if self.mentions else mention
         self.update_embed()
         await interaction.response.edit_message(embed=self.embed)
 
@@ -132,8 +144,13 @@ class ValorantStackView(discord.ui.View):
 
     @discord.ui.button(label="Leave", style=discord.ButtonStyle.red)
     async def leave_callback(self, button, interaction):
-        if interaction.user.id in self.joined:
-            self.joined.pop(interaction.user.id)
+        # Nothing changed, so acknowledge without editing the message
+        if interaction.user.id not in self.joined:
+            await interaction.response.defer()
+            return
+
+        self.joined.pop(interaction.user.id)
+        self.mentions = "\n".join(user.mention for user in self.joined.values())
         self.update_embed()
         await interaction.response.edit_message(embed=self.embed)
 
@@ -144,36 +161,46 @@ class ValorantStackView(discord.ui.View):
         await interaction.response.send_message(embed=self.embed, view=self)
 
 
-def random_map(flags):
-    maps = Config.config["valorant"]["maps"]
-    maps_active = Config.config["valorant"]["maps_active"]
+@functools.lru_cache(maxsize=128)
+def stack_title(num_joined, size):
+    # Title:
+    # - Green square: Person joined under limit
+    # - Yellow square: Person joined over stack size
+    # - White square: Empty slot
+    return (
+        ":green_square:" * min(num_joined, size)
+        + ":yellow_square:" * max(num_joined - size, 0)
+        + ":white_medium_square:" * max(size - num_joined, 0)
+    )
 
-    match flags:
-        case "active":
-            return maps[random.choice(maps_active)]
-        case "newest":
-            return maps[-1]
-        case _:
-            return random.choice(maps)
 
+MAP_PICKERS = {
+    "active": lambda: random.choice(MAPS_ACTIVE),
+    "newest": lambda: MAPS[-1],
+    "all": lambda: random.choice(MAPS),
+}
 
-def random_team(flags):
-    agents = Config.config["valorant"]["agents"]
-    agents_roles = copy.deepcopy(Config.config["valorant"]["agents_roles"]) # copy because pop
 
+def random_map(flags):
+    pick = MAP_PICKERS.get(flags, MAP_PICKERS["all"])
+    return pick()
+
+
+def random_team(flags):
     match flags:
         case "role-balanced":
-            # pop random agent from each role
-            team = [agents[role.pop(random.randrange(len(role)))] for role in agents_roles.values()]
+            # pick random agent from each role
+            picks = [random.choice(role) for role in AGENTS_ROLES.values()]
+            team = [AGENTS[i] for i in picks]
 
-            # fill in remaining agent
-            remaining_agents = [i for role in agents_roles.values() for i in role]
-            team.append(agents[random.choice(remaining_agents)])
+            # fill in remaining agent from those not picked
+            remaining_agents = [i for i in AGENT_POOL if i not in picks]
+            team.append(AGENTS[random.choice(remaining_agents)])
 
             # shuffle and return
             random.shuffle(team)
             return team
 
         case _:
-            return random.sample(agents, 5)
+            return random.sample(AGENTS, 5)
 
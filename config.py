@@ -1,5 +1,10 @@
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 config_file = "config.yaml"
 secrets_file = "secrets.yaml"
@@ -8,7 +13,7 @@ secrets_file = "secrets.yaml"
 class Config:
 
     with open(config_file, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
 
     with open(secrets_file, "r") as f:
-        secrets = yaml.safe_load(f)
+        secrets = yaml.load(f, Loader=SafeLoader)